@@ -1,22 +1,21 @@
 import math
+import time
 import logging
-import sys
-import os
-
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from rabbitmq_client.rabbitmq_client import RabbitMQConsumer, RabbitMQPublisher
 from collections import defaultdict
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 
 class CollisionMonitor:
-    def __init__(self, rabbitmq_server, input_queue_name):
+    def __init__(
+        self, rabbitmq_server, input_queue_name, min_pause_duration=0.0, start_time=None
+    ):
         self.rabbitmq_server = rabbitmq_server
+        # perf_counter() value at service start, used to log the time to the first message
+        self.start_time = start_time
+        # Seconds a paused robot is held before it may be resumed
+        self.min_pause_duration = min_pause_duration
         self.robot_states = {}  # To store the latest state of each robot
         self.recently_paused_robots = (
             set()
@@ -28,8 +27,28 @@ class CollisionMonitor:
             self.rabbitmq_server, input_queue_name, self.handle_state_update
         )
         self.publishers = {}  # To store RabbitMQPublisher instances for each robot
+        self.command_states = {}  # Last command sent to each robot
+        self.last_command_times = {}  # Monotonic time of each robot's last command
+        self.state_update_counts = defaultdict(
+            int
+        )  # Number of state updates received from each robot
+        self.command_state_updates = (
+            {}
+        )  # Each robot's state update count when its last command was sent
+        self.suppressed_commands = defaultdict(
+            int
+        )  # Number of redundant commands not sent to each robot
+        self.rate_limited_commands = defaultdict(
+            int
+        )  # Number of resumes held back by min_pause_duration for each robot
 
     def handle_state_update(self, message_dict):
+        if self.start_time is not None:
+            logger.info(
+                f"Received first state update {(time.perf_counter() - self.start_time) * 1000:.1f} ms after start"
+            )
+            self.start_time = None
+
         logger.info(f"Received state update: {message_dict}")
         device_id = message_dict.get("device_id")
         if not device_id:
@@ -44,6 +63,10 @@ class CollisionMonitor:
         ):  # If there is only one node left in the path, it means the robot has reached its destination.
             # Remove the robot from the global state and return
             self.robot_states.pop(device_id, None)
+            self.command_states.pop(device_id, None)
+            self.last_command_times.pop(device_id, None)
+            self.state_update_counts.pop(device_id, None)
+            self.command_state_updates.pop(device_id, None)
             logger.info(
                 f"Robot {device_id} has reached its destination and is removed from the global state."
             )
@@ -51,6 +74,7 @@ class CollisionMonitor:
 
         # Update the stored state for the robot
         self.robot_states[device_id] = message_dict
+        self.state_update_counts[device_id] += 1
 
         # Detect all potential collisions between all pairs of robots
         potential_collisions = self.detect_all_collisions()
@@ -167,7 +191,7 @@ class CollisionMonitor:
                 return any(robot_id in deps for deps in self.dependencies.values())
 
             # Check for potential deadlock
-            if all(is_in_dependency_list(dep) for dep in dependencies):
+            if dependencies and all(is_in_dependency_list(dep) for dep in dependencies):
                 logger.info(
                     f"Potential deadlock detected involving {paused_robot} and {', '.join(dependencies)}"
                 )
@@ -184,7 +208,12 @@ class CollisionMonitor:
 
     def resume_robot(self, device_id):
         # Send the 'resume' command to the specified robot
-        self.send_command(device_id, "resume")
+        if not self.send_command(device_id, "resume"):
+            # Keep the dependencies so the resume is retried on a later update
+            logger.info(
+                f"Holding {device_id} paused for at least {self.min_pause_duration}s"
+            )
+            return
 
         # Delete the robot's dependencies
         if device_id in self.dependencies:
@@ -199,6 +228,34 @@ class CollisionMonitor:
         return robot_to_resume
 
     def send_command(self, robot_id, command):
+        # Returns True if the robot is now in the commanded state, False if the command was held back
+        # Robots start active, so a resume is only published after a pause. A pause is
+        # re-sent only if the robot has reported a new state since it and still says it is
+        # active, so a lost pause or a restarted robot is paused again.
+        redundant = self.command_states.get(robot_id, "resume") == command
+        if command == "pause" and redundant:
+            redundant = (
+                self.robot_states.get(robot_id, {}).get("status") == "paused"
+                or self.state_update_counts[robot_id]
+                == self.command_state_updates.get(robot_id)
+            )
+        if redundant:
+            self.suppressed_commands[robot_id] += 1
+            logger.info(f"Suppressed redundant {command} command to {robot_id}")
+            return True
+
+        # Hysteresis: hold a paused robot for min_pause_duration to avoid pause/resume flapping.
+        # Pauses are never delayed since they prevent collisions.
+        now = time.monotonic()
+        if (
+            command == "resume"
+            and now - self.last_command_times.get(robot_id, now)
+            < self.min_pause_duration
+        ):
+            self.rate_limited_commands[robot_id] += 1
+            logger.info(f"Rate limited {command} command to {robot_id}")
+            return False
+
         # Get the existing publisher for the robot or create a new one if it doesn't exist
         publisher = self.publishers.get(robot_id)
         if not publisher:
@@ -210,7 +267,11 @@ class CollisionMonitor:
 
         # Send the command to the specified robot via RabbitMQ
         publisher.send_message({"command": command})
+        self.command_states[robot_id] = command
+        self.last_command_times[robot_id] = now
+        self.command_state_updates[robot_id] = self.state_update_counts[robot_id]
         logger.info(f"Sent {command} command to {robot_id}")
+        return True
 
     def start(self):
         self.consumer.start_consuming()
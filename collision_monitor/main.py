@@ -1,23 +1,33 @@
+import time
+
+# Taken before the other imports so that the start up time includes them
+START_TIME = time.perf_counter()
+
 import os
 import logging
-from collision_monitor import CollisionMonitor
+from collision_monitor.collision_monitor import CollisionMonitor
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 
-def main():
+def main(start_time=START_TIME):
+    # Configure logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
     logger.info("Starting Collision Monitoring Service")
 
     # Define the RabbitMQ server and the queue name for robot states
     rabbitmq_server = os.getenv("RABBITMQ_HOST", "localhost")
     shared_queue_name = os.getenv("RABBITMQ_QUEUE", "robot_states")
+    # Minimum time in seconds a paused robot is held before it may be resumed
+    min_pause_duration = float(os.getenv("MIN_PAUSE_DURATION", "1.0"))
 
     # Initialize the collision monitor
-    collision_monitor = CollisionMonitor(rabbitmq_server, shared_queue_name)
+    collision_monitor = CollisionMonitor(
+        rabbitmq_server, shared_queue_name, min_pause_duration, start_time
+    )
 
     # Start the message consumption loop
     try:
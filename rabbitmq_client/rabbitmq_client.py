@@ -1,44 +1,85 @@
-import pika
 import json
 
 
+def _connect(rabbitmq_server):
+    # pika is imported on first connect to keep service start up fast
+    import pika
+
+    return pika.BlockingConnection(pika.ConnectionParameters(host=rabbitmq_server))
+
+
 class RabbitMQPublisher:
     def __init__(self, rabbitmq_server, queue_name):
-        self.connection = pika.BlockingConnection(
-            pika.ConnectionParameters(host=rabbitmq_server)
-        )
-        self.channel = self.connection.channel()
+        self.rabbitmq_server = rabbitmq_server
         self.queue_name = queue_name
-        self.channel.queue_declare(queue=self.queue_name)
+        self.connection = None  # Opened lazily on the first message
+        self.channel = None
+
+    def connect(self):
+        if self.connection:
+            return
+        # Only keep the connection once it is fully set up, so a failed connect is retried
+        connection = _connect(self.rabbitmq_server)
+        try:
+            channel = connection.channel()
+            channel.queue_declare(queue=self.queue_name)
+        except Exception:
+            if connection.is_open:
+                connection.close()
+            raise
+        self.connection, self.channel = connection, channel
 
     def send_message(self, message):
+        self.connect()
         self.channel.basic_publish(
             exchange="", routing_key=self.queue_name, body=json.dumps(message)
         )
 
     def close(self):
-        self.connection.close()
+        if self.connection:
+            self.connection.close()
 
 
 class RabbitMQConsumer:
     def __init__(self, rabbitmq_server, queue_name, callback):
-        self.connection = pika.BlockingConnection(
-            pika.ConnectionParameters(host=rabbitmq_server)
-        )
-        self.channel = self.connection.channel()
+        self.rabbitmq_server = rabbitmq_server
         self.queue_name = queue_name
-        self.channel.queue_declare(queue=self.queue_name)
-        self.channel.basic_consume(
-            queue=self.queue_name, on_message_callback=self.on_message, auto_ack=True
-        )
         self.callback = callback
+        self.connection = None  # Opened lazily when consuming starts
+        self.channel = None
+
+    def connect(self):
+        if self.connection:
+            return
+        # Only keep the connection once it is fully set up, so a failed connect is retried
+        connection = _connect(self.rabbitmq_server)
+        try:
+            channel = connection.channel()
+            channel.queue_declare(queue=self.queue_name)
+            channel.basic_consume(
+                queue=self.queue_name,
+                on_message_callback=self.on_message,
+                auto_ack=True,
+            )
+        except Exception:
+            if connection.is_open:
+                connection.close()
+            raise
+        self.connection, self.channel = connection, channel
 
     def on_message(self, ch, method, properties, body):
         message_dict = json.loads(body)
         self.callback(message_dict)
 
     def start_consuming(self):
-        self.channel.start_consuming()
+        self.connect()
+        try:
+            self.channel.start_consuming()
+        except Exception:
+            # Drop the broken connection so the next call reconnects
+            self.connection, self.channel = None, None
+            raise
 
     def close(self):
-        self.connection.close()
+        if self.connection:
+            self.connection.close()
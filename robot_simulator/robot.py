@@ -1,16 +1,9 @@
 import time
 import logging
 import threading
-import sys
 import os
-
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from rabbitmq_client.rabbitmq_client import RabbitMQConsumer, RabbitMQPublisher
 
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
-
 
 class Robot:
     def __init__(self, device_id, initial_position, path, rabbitmq_server):
@@ -27,10 +20,9 @@ class Robot:
         self.consumer = RabbitMQConsumer(
             rabbitmq_server, f"{self.device_id}_commands", self.handle_command
         )
-        self.command_listener_thread = threading.Thread(
-            target=self.listen_commands, daemon=True
-        )
-        self.command_listener_thread.start()
+        # The command listener is started after the first state message, since the
+        # collision monitor can't send commands before it has seen the robot
+        self.command_listener_thread = None
 
     def handle_command(self, message_dict):
         command = message_dict.get("command")
@@ -95,6 +87,7 @@ class Robot:
             "theta": self.theta,
             "battery_level": self.battery_level,
             "loaded": self.loaded,
+            "status": self.status,
             "path": self.path[self.path_index :],  # Remaining path
         }
 
@@ -103,11 +96,27 @@ class Robot:
             state_message = self.get_state()
             self.publisher.send_message(state_message)
             logging.info(f"Sent state message for {self.device_id}")
+            self.start_listening()
+            return True
         except Exception as e:
             logging.error(f"Failed to send state message for {self.device_id}: {e}")
+            return False
+
+    def start_listening(self):
+        if self.command_listener_thread:
+            return
+        self.command_listener_thread = threading.Thread(
+            target=self.listen_commands, daemon=True
+        )
+        self.command_listener_thread.start()
 
     def listen_commands(self):
-        self.consumer.start_consuming()
+        try:
+            self.consumer.start_consuming()
+        except Exception as e:
+            # Let the next state message restart the listener
+            logging.error(f"Failed to listen for commands for {self.device_id}: {e}")
+            self.command_listener_thread = None
 
     def close(self):
         self.consumer.close()
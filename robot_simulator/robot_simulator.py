@@ -1,14 +1,14 @@
-import logging
-from robot import Robot
 import time
+
+# Taken before the other imports so that the start up time includes them
+START_TIME = time.perf_counter()
+
+import logging
+from robot_simulator.robot import Robot
 import json
 import sys
 import os
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 
@@ -26,7 +26,12 @@ def validate_robot_details(robot_details):
         raise ValueError("Invalid path format")
 
 
-def main():
+def main(start_time=START_TIME):
+    # Configure logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
     logger.info("Starting application")
     filename = os.getenv("ROBOT_CONFIG_FILE")
 
@@ -60,12 +65,26 @@ def main():
         path=robot_details["path"],
         rabbitmq_server=rabbitmq_server,
     )
+
+    # Connect eagerly so an unreachable broker stops the simulator instead of
+    # leaving the robot moving without collision control
+    robot.publisher.connect()
+
+    # Publish the initial state before moving, which also starts the command listener
+    if not robot.send_state():
+        logger.error("Failed to send the initial state, not starting the robot")
+        robot.close()
+        sys.exit(1)
+    logger.info(
+        f"Sent first state message {(time.perf_counter() - start_time) * 1000:.1f} ms after start"
+    )
+
     # Simulate the robot's movement and send its state to RabbitMQ
     while robot.path_index < len(robot.path) - 1:
+        time.sleep(1)  # Wait for 1 second to simulate real-time state updates at 1Hz
         logger.info("Moving robot and sending state to RabbitMQ")
         robot.move()
-        robot.send_state()
-        time.sleep(1)  # Wait for 1 second to simulate real-time state updates at 1Hz
+        robot.send_state()  # Wait for 1 second to simulate real-time state updates at 1Hz
 
     # Close the RabbitMQ connection when done
     logger.info("Closing RabbitMQ connection")
@@ -73,5 +92,4 @@ def main():
 
 
 if __name__ == "__main__":
-    time.sleep(1)  # wait for collision monitor to start in docker-compose setup
     main()
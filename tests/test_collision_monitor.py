@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import patch
+from unittest.mock import call, patch
 from collision_monitor.collision_monitor import CollisionMonitor
 
 
@@ -114,6 +114,111 @@ class TestCollisionMonitor(unittest.TestCase):
         # Assertions
         self.assertEqual(len(self.collision_monitor.robot_states), 0, "No robots should be in robot_states")
 
+    def test_first_state_update_logs_start_up_time(self):
+        self.collision_monitor.start_time = 0.0
+        state1 = {"device_id": "robot1", "path": [{"x": 1, "y": 1}, {"x": 20, "y": 20}]}
+
+        with self.assertLogs('collision_monitor.collision_monitor', level='INFO') as logs:
+            self.collision_monitor.handle_state_update(state1)
+            self.collision_monitor.handle_state_update(state1)
+
+        first_update_logs = [line for line in logs.output if "first state update" in line]
+        self.assertEqual(len(first_update_logs), 1, "Start up time should only be logged for the first message")
+
+    def test_redundant_commands_suppressed(self):
+        with patch.object(self.collision_monitor, 'publishers',
+                        robot1=self.MockPublisher):
+
+            self.collision_monitor.send_command('robot1', 'resume')
+            self.collision_monitor.send_command('robot1', 'pause')
+            self.collision_monitor.send_command('robot1', 'pause')
+
+            # The pause is not re-sent until the robot has reported a new state.
+            publisher = self.collision_monitor.publishers.get.return_value
+            self.assertEqual(publisher.send_message.call_count, 1, "Only the pause transition should be sent")
+
+            # A confirmed pause is not re-sent either.
+            state1 = {"device_id": "robot1", "status": "paused", "path": [{"x": 1, "y": 1}, {"x": 20, "y": 20}]}
+            self.collision_monitor.handle_state_update(state1)
+            self.collision_monitor.send_command('robot1', 'pause')
+
+            self.assertEqual(publisher.send_message.call_count, 1, "A confirmed pause should not be re-sent")
+            self.assertEqual(self.collision_monitor.command_states['robot1'], 'pause')
+            self.assertEqual(self.collision_monitor.suppressed_commands['robot1'], 3, "Three commands should be suppressed")
+
+    def test_pause_resent_when_robot_reports_active(self):
+        with patch.object(self.collision_monitor, 'publishers',
+                        robot1=self.MockPublisher):
+
+            self.collision_monitor.send_command('robot1', 'pause')
+
+            # Simulate a lost pause or a restarted robot reporting itself active.
+            state1 = {"device_id": "robot1", "status": "active", "path": [{"x": 1, "y": 1}, {"x": 20, "y": 20}]}
+            self.collision_monitor.handle_state_update(state1)
+            self.collision_monitor.send_command('robot1', 'pause')
+
+            publisher = self.collision_monitor.publishers.get.return_value
+            self.assertEqual(publisher.send_message.call_args_list,
+                             [call({"command": "pause"}), call({"command": "pause"})],
+                             "The pause should be re-sent to an active robot")
+            self.assertEqual(self.collision_monitor.suppressed_commands['robot1'], 0)
+
+    def test_pause_not_resent_on_other_robots_updates(self):
+        with patch.object(self.collision_monitor, 'publishers',
+                        robot0=self.MockPublisher):
+
+            # 'robot0' and 'robot1' collide, the other robots are far away.
+            states = [
+                {"device_id": "robot0", "status": "active", "path": [{"x": 1, "y": 1}, {"x": 8, "y": 8}]},
+                {"device_id": "robot1", "status": "active", "path": [{"x": 8, "y": 8}, {"x": 15, "y": 15}]},
+            ] + [
+                {"device_id": f"robot{i}", "status": "active", "path": [{"x": 100 * i, "y": 0}, {"x": 100 * i, "y": 1}]}
+                for i in range(2, 8)
+            ]
+            for state in states:
+                self.collision_monitor.handle_state_update(state)
+
+            publisher = self.collision_monitor.publishers.get.return_value
+            self.assertEqual(publisher.send_message.call_args_list, [call({"command": "pause"})],
+                             "The pause should only be published once")
+            self.assertEqual(self.collision_monitor.suppressed_commands['robot0'], 6,
+                             "The pause should be suppressed on each other robot's update")
+
+    def test_resume_held_for_min_pause_duration(self):
+        self.collision_monitor.min_pause_duration = 1.0
+        with patch.object(self.collision_monitor, 'publishers',
+                        robot1=self.MockPublisher,
+                        robot2=self.MockPublisher), \
+                patch('collision_monitor.collision_monitor.time.monotonic', return_value=100.0) as mock_monotonic:
+
+            state1 = {"device_id": "robot1", "path": [{"x": 1, "y": 1}, {"x": 8, "y": 8}]}
+            state2 = {"device_id": "robot2", "path": [{"x": 8, "y": 8}, {"x": 15, "y": 15}]}
+            self.collision_monitor.handle_state_update(state1)
+            self.collision_monitor.handle_state_update(state2)
+            self.assertIn('robot1', self.collision_monitor.dependencies, "'robot1' should be paused")
+
+            # 'robot2' moves away within the hold window, so 'robot1' stays paused.
+            mock_monotonic.return_value = 100.5
+            state2_moved = {"device_id": "robot2", "path": [{"x": 15, "y": 15}, {"x": 22, "y": 22}]}
+            self.collision_monitor.handle_state_update(state2_moved)
+            self.assertIn('robot1', self.collision_monitor.dependencies, "'robot1' should be held paused")
+            self.assertEqual(self.collision_monitor.command_states['robot1'], 'pause')
+            self.assertEqual(self.collision_monitor.rate_limited_commands['robot1'], 1, "One resume should be rate limited")
+
+            # Once the hold window has elapsed, the next update resumes 'robot1'.
+            mock_monotonic.return_value = 101.0
+            state2_moved = {"device_id": "robot2", "path": [{"x": 22, "y": 22}, {"x": 29, "y": 29}]}
+            self.collision_monitor.handle_state_update(state2_moved)
+            self.assertFalse(self.collision_monitor.dependencies, "'robot1' should be resumed after the hold")
+            self.assertEqual(self.collision_monitor.command_states['robot1'], 'resume')
+            self.assertEqual(self.collision_monitor.rate_limited_commands['robot1'], 1)
+            self.assertEqual(self.collision_monitor.suppressed_commands['robot1'], 0, "No redundant commands should be decided")
+
+            publisher = self.collision_monitor.publishers.get.return_value
+            self.assertEqual(publisher.send_message.call_args_list,
+                             [call({"command": "pause"}), call({"command": "resume"})],
+                             "Exactly one pause and one resume should be published")
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -0,0 +1,49 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from rabbitmq_client.rabbitmq_client import RabbitMQConsumer, RabbitMQPublisher
+
+
+class TestRabbitMQClient(unittest.TestCase):
+
+    def setUp(self):
+        self.rabbitmq_server = 'some_server'
+        self.queue_name = 'some_queue'
+
+    def test_no_connection_on_init(self):
+        with patch('pika.BlockingConnection') as MockConnection:
+            RabbitMQPublisher(self.rabbitmq_server, self.queue_name)
+            RabbitMQConsumer(self.rabbitmq_server, self.queue_name, MagicMock())
+
+            MockConnection.assert_not_called()
+
+    def test_publisher_retries_failed_connect(self):
+        with patch('pika.BlockingConnection') as MockConnection:
+            channel = MockConnection.return_value.channel.return_value
+            channel.queue_declare.side_effect = [Exception("queue_declare failed"), None]
+            publisher = RabbitMQPublisher(self.rabbitmq_server, self.queue_name)
+
+            with self.assertRaises(Exception):
+                publisher.send_message({"command": "pause"})
+            self.assertIsNone(publisher.connection, "A failed connect should not be kept")
+
+            publisher.send_message({"command": "pause"})
+            self.assertEqual(MockConnection.call_count, 2, "The connect should be retried")
+            channel.basic_publish.assert_called_once()
+
+    def test_consumer_retries_failed_connect(self):
+        with patch('pika.BlockingConnection') as MockConnection:
+            channel = MockConnection.return_value.channel.return_value
+            channel.basic_consume.side_effect = [Exception("basic_consume failed"), None]
+            consumer = RabbitMQConsumer(self.rabbitmq_server, self.queue_name, MagicMock())
+
+            with self.assertRaises(Exception):
+                consumer.start_consuming()
+            self.assertIsNone(consumer.connection, "A failed connect should not be kept")
+
+            consumer.start_consuming()
+            self.assertEqual(MockConnection.call_count, 2, "The connect should be retried")
+            channel.start_consuming.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
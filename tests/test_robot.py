@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from robot_simulator.robot import Robot  # Ensure this is the correct import
 
 
@@ -61,6 +61,39 @@ class TestRobot(unittest.TestCase):
         self.robot.handle_command(message_dict)
         self.assertNotEqual(self.robot.status, 'invalid', "Robot should not accept invalid status")
 
+    def test_get_state_includes_status(self):
+        self.assertEqual(self.robot.get_state()['status'], 'active')
+        self.robot.pause()
+        self.assertEqual(self.robot.get_state()['status'], 'paused')
+
+    def test_send_state_starts_command_listener(self):
+        self.assertIsNone(self.robot.command_listener_thread, "Command listener should not start in __init__")
+
+        self.robot.send_state()
+        listener_thread = self.robot.command_listener_thread
+        self.assertIsNotNone(listener_thread, "Command listener should start after the first state message")
+
+        self.robot.send_state()
+        self.assertIs(self.robot.command_listener_thread, listener_thread, "Command listener should only start once")
+
+    def test_listener_failure_restarts_on_next_state(self):
+        self.robot.consumer.start_consuming.side_effect = Exception("connection refused")
+        self.robot.command_listener_thread = MagicMock()
+
+        self.robot.listen_commands()
+        self.assertIsNone(self.robot.command_listener_thread, "A failed listener should be reset")
+
+        self.robot.consumer.start_consuming.side_effect = None
+        self.robot.send_state()
+        self.assertIsNotNone(self.robot.command_listener_thread, "The next state message should restart the listener")
+
+    def test_send_state_failure(self):
+        self.robot.publisher.send_message.side_effect = Exception("connection refused")
+
+        self.assertFalse(self.robot.send_state(), "A failed state message should be reported")
+        self.assertIsNone(self.robot.command_listener_thread, "Command listener should not start without a state message")
+
+
 
 if __name__ == '__main__':
     unittest.main()
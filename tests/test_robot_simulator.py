@@ -0,0 +1,44 @@
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+from robot_simulator.robot_simulator import main
+
+ROBOT_CONFIG_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'robot_simulator', 'robot_states', 'robot_1.json',
+)
+
+
+class TestRobotSimulator(unittest.TestCase):
+
+    def setUp(self):
+        env_patcher = patch.dict(os.environ, {'ROBOT_CONFIG_FILE': ROBOT_CONFIG_FILE})
+        robot_patcher = patch('robot_simulator.robot_simulator.Robot', autospec=True)
+        env_patcher.start()
+        self.MockRobot = robot_patcher.start()
+        self.addCleanup(env_patcher.stop)
+        self.addCleanup(robot_patcher.stop)
+
+        self.robot = self.MockRobot.return_value
+        # autospec doesn't create attributes that are set in __init__
+        self.robot.publisher = MagicMock()
+
+    def test_broker_unreachable(self):
+        self.robot.publisher.connect.side_effect = Exception("connection refused")
+
+        with self.assertRaises(Exception):
+            main()
+        self.robot.move.assert_not_called()
+        self.robot.send_state.assert_not_called()
+
+    def test_initial_state_not_sent(self):
+        self.robot.send_state.return_value = False
+
+        with self.assertRaises(SystemExit):
+            main()
+        self.robot.move.assert_not_called()
+        self.robot.close.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
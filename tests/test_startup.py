@@ -0,0 +1,61 @@
+import os
+import subprocess
+import sys
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Import-time budget for each service entrypoint, in microseconds
+IMPORT_TIME_BUDGET_US = 100_000
+
+
+def import_times(module_name):
+    # Run a fresh interpreter with -X importtime and parse its report from stderr:
+    # "import time: self [us] | cumulative | imported package"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, package = line[len("import time:") :].split("|")
+        times[package.strip()] = int(cumulative)
+    return times
+
+
+class TestStartup(unittest.TestCase):
+
+    def assert_fast_import(self, module_name):
+        times = import_times(module_name)
+
+        self.assertIn(module_name, times, f"{module_name} should be imported")
+        self.assertLess(times[module_name], IMPORT_TIME_BUDGET_US,
+                        f"Importing {module_name} should take less than {IMPORT_TIME_BUDGET_US} us")
+        self.assertNotIn('pika', times, "pika should only be imported when connecting to RabbitMQ")
+
+    def test_collision_monitor_import_time(self):
+        self.assert_fast_import('collision_monitor.main')
+
+    def test_robot_simulator_import_time(self):
+        self.assert_fast_import('robot_simulator.robot_simulator')
+
+    def test_import_does_not_configure_logging(self):
+        result = subprocess.run(
+            [sys.executable, "-c",
+             "import logging, collision_monitor.main, robot_simulator.robot_simulator; "
+             "print(len(logging.getLogger().handlers))"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout.strip(), "0", "Logging should only be configured by the entrypoints")
+
+
+if __name__ == '__main__':
+    unittest.main()